@@ -16,43 +16,119 @@ Features:
 
 import argparse
 import asyncio
+import csv
 import datetime
+import itertools
 import logging
 import os
 import re
 import signal
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 
 import ffmpeg_asyncio as ffmpeg
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+log = logging.getLogger("livestream-capture")
+
+# Linux-only fcntl; the constant is only exposed by the fcntl module on Python 3.10+
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031) if sys.platform.startswith('linux') else None
+PIPE_SIZE = 1 << 20  # 1 MiB, enough to absorb ffmpeg log bursts
+PAGE_CACHE_TAIL = 16 << 20  # Leave the last 16 MiB of a file being written in the page cache
+STREAM_LIMIT = 1 << 20  # 1 MiB, longest partial stderr line buffered before it is handed over anyway
+
+# ffmpeg log lines worth surfacing, matched case-insensitively on the raw bytes
+_WARN_RE = re.compile(rb'(?i)error|warning')
+
+# Zero-padded "00".."99", so formatting durations is just table lookups
+_ZP = tuple(f"{i:02d}" for i in range(100))
+
+
+@lru_cache(maxsize=4096)
+def _fmt_hms(total_seconds):
+    """Format a number of seconds as HH:MM:SS."""
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    hh = _ZP[hours] if hours < 100 else str(hours)
+    return f"{hh}:{_ZP[minutes]}:{_ZP[seconds]}"
+
+
+class _StderrLineProtocol(asyncio.subprocess.SubprocessStreamProtocol):
+    """Subprocess protocol that hands ffmpeg's stderr to a callback line by line.
+
+    Data is split as it arrives from the pipe instead of being copied into a
+    StreamReader and awaited one readline() at a time.
+    """
+
+    def __init__(self, on_line, limit, loop):
+        super().__init__(limit=limit, loop=loop)
+        self._on_line = on_line
+        self._line_limit = limit
+        self._pending = b''
+
+    def connection_made(self, transport):
+        super().connection_made(transport)
+        # stderr is consumed directly in pipe_data_received, no reader needed
+        self.stderr = None
+
+    def pipe_data_received(self, fd, data):
+        if fd != 2:
+            return super().pipe_data_received(fd, data)
+
+        # ffmpeg ends its stats lines with '\r' and everything else with '\n'
+        lines = (self._pending + data).replace(b'\r', b'\n').split(b'\n')
+        self._pending = lines.pop()
+        for line in lines:
+            if line:
+                self._on_line(line)
+
+        if len(self._pending) > self._line_limit:
+            # Safety net: hand over an overlong line instead of buffering it without bound
+            line, self._pending = self._pending, b''
+            self._on_line(line)
+
+    def pipe_connection_lost(self, fd, exc):
+        if fd == 2 and self._pending:
+            # Flush a final line that had no trailing newline
+            line, self._pending = self._pending, b''
+            self._on_line(line)
+        super().pipe_connection_lost(fd, exc)
+
+
 class LiveStreamCapture:
+    # Hands out CPUs round-robin to captures started with cpu="auto"
+    _cpu_counter = itertools.count()
+
     def __init__(self, m3u8_url, output_dir="recordings", filename=None,
                  add_datetime=False, segment_time=None, segment_format=None,
-                 complete_segment=False, ffmpeg_path=None):
+                 complete_segment=False, ffmpeg_path=None, cpu=None, nice=None):
         """Initialize the HLS stream capture."""
         self.url = m3u8_url
         self.output_dir = Path(output_dir)
         self.process = None
+        self._stop_task = None
+        self._stop_event = None  # Set by the signal handler, created once the loop is running
         self.is_running = False
-        self.start_time = None
+        self.start_time = None  # Wall-clock start time of the capture
+        self._mono_start = None  # Monotonic start, for measuring durations
         self.stopping = False
         self.add_datetime = add_datetime
         self.ffmpeg_path = ffmpeg_path
+        self.cpu = cpu  # CPU to pin ffmpeg to, or "auto" to pick one per capture
+        self.nice = nice  # Niceness increment for ffmpeg relative to this process
 
         # Segmentation options
         self.segment_time = segment_time  # Time in seconds for each segment
         self.segment_format = segment_format  # Format string for segmented filenames
         self.complete_segment = complete_segment  # Whether to complete current segment when stopping
-
-        # Set up logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        self.logger = logging.getLogger("livestream-capture")
+        self.segment_list_path = None  # CSV list ffmpeg appends to as each segment completes
+        self._segment_list_mark = None  # List size when a stop-after-segment was requested
 
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -83,10 +159,11 @@ class LiveStreamCapture:
     async def start_capture(self):
         """Start capturing the HLS stream using ffmpeg-asyncio."""
         # Register signal handlers for graceful exit
+        self._stop_event = asyncio.Event()
         self._setup_signal_handlers()
 
         try:
-            self.logger.info(f"Starting stream capture from: {self.url}")
+            log.info(f"Starting stream capture from: {self.url}")
 
             # Build the FFmpeg command
             cmd = ['-y']  # Overwrite output file if it exists
@@ -109,6 +186,12 @@ class LiveStreamCapture:
 
                 segment_path = str(self.output_dir / self.segment_format)
 
+                # ffmpeg reports finished segments here, so we don't have to parse its log
+                base_name = os.path.splitext(self.filename)[0]
+                self.segment_list_path = self.output_dir / f"{base_name}_segments.csv"
+                if self.segment_list_path.exists():
+                    self.segment_list_path.unlink()
+
                 # Add segmentation options
                 cmd.extend([
                     '-f', 'segment',
@@ -116,136 +199,228 @@ class LiveStreamCapture:
                     '-reset_timestamps', '1',
                     '-segment_start_number', '1',
                     '-segment_format', 'mp4',
+                    '-segment_list', str(self.segment_list_path),
+                    '-segment_list_type', 'csv',
                     segment_path
                 ])
 
-                self.logger.info(f"Segmenting output every {self.segment_time} seconds")
-                self.logger.info(f"Segment format: {self.segment_format}")
+                log.info(f"Segmenting output every {self.segment_time} seconds")
+                log.info(f"Segment format: {self.segment_format}")
 
                 if self.complete_segment:
-                    self.logger.info("Will complete current segment when stopping (Ctrl+C)")
+                    log.info("Will complete current segment when stopping (Ctrl+C)")
             else:
-                # Regular non-segmented output
+                # Regular non-segmented output, written as a fragmented MP4 so the
+                # file stays playable even if ffmpeg is killed before writing a trailer
                 output_path = str(self.output_path)
+                cmd.extend(['-movflags', '+frag_keyframe+empty_moov+default_base_moof'])
                 cmd.append(output_path)
-                self.logger.info(f"Output will be saved to: {output_path}")
+                log.info(f"Output will be saved to: {output_path}")
 
             # Start tracking time
             self.start_time = datetime.datetime.now()
+            self._mono_start = time.monotonic()
             self.is_running = True
             self.stopping = False
 
             # Variables to track segment progress
             current_segment = 1
-            segment_start_time = self.start_time
-            segment_pattern = re.compile(r'Opening \'.*?(\d+)\.mp4\'')
+            segment_mono_start = self._mono_start
+
+            # Page cache trimming state, only used where posix_fadvise exists
+            drop_cache = hasattr(os, 'posix_fadvise')
+            finished_segments = []  # Completed segment files not yet dropped from the page cache
+            advised_once = []  # Segments dropped once, due a second pass
+            list_position = 0  # How far into the segment list we've read
+
+            # Monitor progress
+            progress_interval = 5  # Update progress every 5 seconds
+            segment_list_interval = 1  # Check the segment list every second
+            page_cache_interval = 30  # Drop written recording data from the page cache this often
+
+            # Show progress on a timer, independent of how chatty ffmpeg is
+            async def report_progress():
+                while True:
+                    await asyncio.sleep(progress_interval)
+                    if not self.is_running:
+                        break
+
+                    now = time.monotonic()
+                    elapsed = int(now - self._mono_start)
+
+                    if self.segment_time:
+                        segment_elapsed = int(now - segment_mono_start)
+                        log.info(f"Recording: {_fmt_hms(elapsed)} "
+                                 f"(Current segment {current_segment}: {_fmt_hms(segment_elapsed)})")
+                    else:
+                        log.info(f"Recording duration: {_fmt_hms(elapsed)}")
+
+            # Yield (offset, row) for complete rows ffmpeg has added to its segment list
+            def read_segment_list():
+                nonlocal list_position
+
+                try:
+                    size = self.segment_list_path.stat().st_size
+                except FileNotFoundError:
+                    return  # ffmpeg hasn't opened its output yet
+                if size < list_position:
+                    list_position = 0  # Truncated, start over
+                if size == list_position:
+                    return
+
+                with open(self.segment_list_path, 'rb') as f:
+                    f.seek(list_position)
+                    data = f.read()
+                # Only consume complete rows; ffmpeg may be mid-write
+                end = data.rfind(b'\n') + 1
+
+                for raw_row in data[:end].splitlines(keepends=True):
+                    row_start = list_position
+                    list_position += len(raw_row)
+
+                    # Rows are "<filename>,<start_time>,<end_time>"
+                    row = next(csv.reader([raw_row.decode('utf-8', errors='replace')]), [])
+                    if len(row) >= 3:
+                        yield row_start, row
+
+            # Follow ffmpeg's segment list; each new row is one completed segment
+            async def watch_segment_list():
+                nonlocal current_segment, segment_mono_start
+
+                while self.is_running:
+                    await asyncio.sleep(segment_list_interval)
+
+                    for row_start, row in read_segment_list():
+                        if drop_cache:
+                            finished_segments.append(self.output_dir / row[0])
+
+                        try:
+                            segment_duration = int(float(row[2]) - float(row[1]))
+                        except ValueError:
+                            segment_duration = int(time.monotonic() - segment_mono_start)
+
+                        log.info(f"Segment {current_segment} completed "
+                                 f"(duration: {_fmt_hms(segment_duration)})")
+
+                        # If we're stopping at segment completion, now's the time. Rows that
+                        # were already in the list when the stop was requested don't count:
+                        # those segments finished before the request, not the current one.
+                        if (self.stopping and self.complete_segment
+                                and self._segment_list_mark is not None
+                                and row_start >= self._segment_list_mark):
+                            log.info("Stopping as requested after segment completion")
+                            self.stop_capture()
+                            return
+
+                        current_segment += 1
+                        segment_mono_start = time.monotonic()
+
+            # We never read recordings back, so keep them from crowding out the page cache
+            async def drop_page_cache():
+                nonlocal advised_once
+
+                while self.is_running:
+                    await asyncio.sleep(page_cache_interval)
+
+                    if self.segment_time:
+                        # Finished segments get a second pass to catch pages that were
+                        # still dirty (and so couldn't be dropped) the first time
+                        batch = advised_once + finished_segments
+                        advised_once = list(finished_segments)
+                        finished_segments.clear()
+                        for path in batch:
+                            self._drop_page_cache(path)
+                    else:
+                        self._drop_page_cache(self.output_path, keep_tail=PAGE_CACHE_TAIL)
+
+            # Bind hot-path lookups once instead of resolving them for every stderr line
+            warn = log.warning
+            search_warning = _WARN_RE.search
+
+            # Process output, called synchronously for each stderr line as it arrives
+            def handle_line(line):
+                # Log error messages, decoding only the lines we actually emit
+                if search_warning(line):
+                    line_str = line.decode('utf-8', errors='replace').strip()
+                    warn(f"ffmpeg: {line_str}")
 
             # Start ffmpeg process with asyncio
-            self.logger.info("Press Ctrl+C to stop recording...")
+            log.info("Press Ctrl+C to stop recording...")
 
             # Create process
-            process = await asyncio.create_subprocess_exec(
+            loop = asyncio.get_running_loop()
+            transport, protocol = await loop.subprocess_exec(
+                lambda: _StderrLineProtocol(handle_line, limit=STREAM_LIMIT, loop=loop),
                 'ffmpeg', *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,  # ffmpeg writes nothing to stdout here
+                stderr=asyncio.subprocess.PIPE,  # Kept so ffmpeg's errors and warnings get logged
+                preexec_fn=self._child_setup()  # CPU pinning / niceness, if requested
             )
+            process = asyncio.subprocess.Process(transport, protocol, loop)
             self.process = process
 
-            # Monitor progress
-            last_progress_update = time.time()
-            progress_interval = 5  # Update progress every 5 seconds
+            # Give ffmpeg's stderr pipe room so it never blocks writing logs
+            self._enlarge_pipe(transport.get_pipe_transport(2))
 
-            # Process output
-            async def read_output(stream, is_stderr=False):
-                nonlocal current_segment, segment_start_time, last_progress_update
-
-                while True:
-                    line = await stream.readline()
-                    if not line:
-                        break
+            self._check_priority(process.pid)
 
-                    line_str = line.decode('utf-8', errors='replace').strip()
+            # Start the progress timer, the segment list watcher when segmenting,
+            # and page cache trimming where the platform supports it
+            background_tasks = [asyncio.create_task(report_progress())]
+            if self.segment_time:
+                background_tasks.append(asyncio.create_task(watch_segment_list()))
+            if drop_cache:
+                background_tasks.append(asyncio.create_task(drop_page_cache()))
 
-                    # Check for segment change in output
-                    if is_stderr and self.segment_time:
-                        match = segment_pattern.search(line_str)
-                        if match:
-                            segment_num = int(match.group(1))
-                            if segment_num > current_segment:
-                                now = datetime.datetime.now()
-                                segment_duration = now - segment_start_time
-                                hours, remainder = divmod(segment_duration.seconds, 3600)
-                                minutes, seconds = divmod(remainder, 60)
-
-                                self.logger.info(f"Segment {current_segment} completed "
-                                                f"(duration: {hours:02d}:{minutes:02d}:{seconds:02d})")
-
-                                # If we're stopping at segment completion, now's the time
-                                if self.stopping and self.complete_segment:
-                                    self.logger.info("Stopping as requested after segment completion")
-                                    self.stop_capture()
-                                    return
-
-                                current_segment = segment_num
-                                segment_start_time = now
-
-                    # Log error messages
-                    if is_stderr and ('error' in line_str.lower() or 'warning' in line_str.lower()):
-                        self.logger.warning(f"ffmpeg: {line_str}")
-
-                    # Show progress periodically
-                    current_time = time.time()
-                    if current_time - last_progress_update >= progress_interval:
-                        duration = datetime.datetime.now() - self.start_time
-                        hours, remainder = divmod(duration.seconds, 3600)
-                        minutes, seconds = divmod(remainder, 60)
-
-                        if self.segment_time:
-                            segment_duration = datetime.datetime.now() - segment_start_time
-                            s_hours, s_remainder = divmod(segment_duration.seconds, 3600)
-                            s_minutes, s_seconds = divmod(s_remainder, 60)
-
-                            self.logger.info(f"Recording: {hours:02d}:{minutes:02d}:{seconds:02d} "
-                                           f"(Current segment {current_segment}: {s_hours:02d}:{s_minutes:02d}:{s_seconds:02d})")
-                        else:
-                            self.logger.info(f"Recording duration: {hours:02d}:{minutes:02d}:{seconds:02d}")
-
-                        last_progress_update = current_time
-
-            # Start readers for stdout and stderr
-            stdout_task = asyncio.create_task(read_output(process.stdout, False))
-            stderr_task = asyncio.create_task(read_output(process.stderr, True))
-
-            # Wait for process to complete
+            # Wait for process to complete, or for a signal asking us to stop
+            exit_task = asyncio.ensure_future(process.wait())
+            stop_wait = asyncio.ensure_future(self._stop_event.wait())
             try:
-                await process.wait()
+                await asyncio.wait({exit_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                if not exit_task.done():
+                    self.stop_capture()
+                    await exit_task
             except asyncio.CancelledError:
                 # Handle cancellation
                 if self.is_running:
                     self.stop_capture()
+                if self._stop_task:
+                    await self._stop_task
             finally:
-                # Cancel output readers if they're still running
-                stdout_task.cancel()
-                stderr_task.cancel()
+                # Cancel background tasks and the stop waiter if they're still running
+                tasks = [*background_tasks, stop_wait, exit_task]
+                for task in tasks:
+                    task.cancel()
                 try:
-                    await asyncio.gather(stdout_task, stderr_task, return_exceptions=True)
+                    await asyncio.gather(*tasks, return_exceptions=True)
                 except asyncio.CancelledError:
                     pass
 
+                # ffmpeg has closed its files, so nothing is left to keep hot: drop the
+                # last segments (including any the watcher never got to) or the whole file
+                if drop_cache and process.returncode is not None:
+                    if self.segment_time:
+                        remaining = [self.output_dir / row[0] for _, row in read_segment_list()]
+                        for path in advised_once + finished_segments + remaining:
+                            self._drop_page_cache(path)
+                    else:
+                        self._drop_page_cache(self.output_path)
+
             # Process completed or was stopped
             if process.returncode != 0 and not self.stopping:
-                self.logger.error(f"Error: ffmpeg exited with code {process.returncode}")
+                log.error(f"Error: ffmpeg exited with code {process.returncode}")
                 return False
             else:
                 self.is_running = False
                 if self.stopping:
-                    self.logger.info("Capture stopped by user")
+                    log.info("Capture stopped by user")
                 else:
-                    self.logger.info("Stream capture completed successfully")
+                    log.info("Stream capture completed successfully")
                 return True
 
         except Exception as e:
-            self.logger.error(f"Error capturing stream: {str(e)}")
+            log.error(f"Error capturing stream: {str(e)}")
             self.stop_capture()
             return False
 
@@ -256,53 +431,191 @@ class LiveStreamCapture:
 
         if self.segment_time and self.complete_segment and not self.stopping:
             # Mark as stopping but don't terminate yet
-            self.stopping = True
-            self.logger.info("Will stop after current segment completes...")
+            self._stop_after_segment()
+            log.info("Will stop after current segment completes...")
             return
 
         self.is_running = False
-        self.logger.info("\nStopping stream capture gracefully...")
+        log.info("\nStopping stream capture gracefully...")
 
-        # Terminate process if it's still running
+        # Ask ffmpeg to quit if it's still running
         if self.process and self.process.returncode is None:
-            try:
-                if hasattr(self.process, 'terminate') and callable(getattr(self.process, 'terminate')):
-                    self.process.terminate()
-            except Exception as e:
-                self.logger.error(f"Error stopping ffmpeg: {str(e)}")
+            self._stop_task = asyncio.create_task(self._graceful_stop())
 
-        if self.start_time:
-            duration = datetime.datetime.now() - self.start_time
-            hours, remainder = divmod(duration.seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
+        if self._mono_start is not None:
+            elapsed = int(time.monotonic() - self._mono_start)
 
             if self.segment_time:
-                self.logger.info(f"Stream segments saved to: {self.output_dir}")
+                log.info(f"Stream segments saved to: {self.output_dir}")
+            else:
+                log.info(f"Stream capture completed: {self.output_path}")
+
+            log.info(f"Total recording time: {_fmt_hms(elapsed)}")
+
+    def _child_setup(self):
+        """Build the preexec_fn that applies the requested CPU affinity and niceness.
+
+        Running it in the child before exec means every thread ffmpeg starts
+        inherits the settings; returns None when nothing was requested.
+        """
+        cpu = None
+        if self.cpu is not None:
+            if not hasattr(os, 'sched_setaffinity'):
+                log.warning("CPU pinning is not supported on this platform")
             else:
-                self.logger.info(f"Stream capture completed: {self.output_path}")
+                cpus = sorted(os.sched_getaffinity(0))
+                if self.cpu == "auto":
+                    cpu = cpus[next(self._cpu_counter) % len(cpus)]
+                elif self.cpu in cpus:
+                    cpu = self.cpu
+                else:
+                    log.warning(f"CPU {self.cpu} is not available to this process, not pinning ffmpeg")
+
+        nice = self.nice
+        if nice is not None and not hasattr(os, 'nice'):
+            log.warning("Changing ffmpeg's priority is not supported on this platform")
+            nice = None
+
+        if cpu is None and nice is None:
+            return None
+        if cpu is not None:
+            log.info(f"Pinning ffmpeg to CPU {cpu}")
+
+        def setup():
+            # No logging here, this runs in the forked child; failures leave the defaults
+            if cpu is not None:
+                try:
+                    os.sched_setaffinity(0, {cpu})
+                except OSError:
+                    pass
+            if nice is not None:
+                try:
+                    os.nice(nice)
+                except OSError:
+                    pass
+
+        return setup
+
+    def _check_priority(self, pid):
+        """Warn if ffmpeg didn't end up with the requested niceness."""
+        if self.nice is None or not hasattr(os, 'getpriority'):
+            return
 
-            self.logger.info(f"Total recording time: {hours:02d}:{minutes:02d}:{seconds:02d}")
+        try:
+            expected = os.getpriority(os.PRIO_PROCESS, 0) + self.nice
+            if os.getpriority(os.PRIO_PROCESS, pid) != max(-20, min(19, expected)):
+                log.warning("Could not change ffmpeg's priority")
+        except OSError:
+            pass  # ffmpeg already exited
+
+    def _drop_page_cache(self, path, keep_tail=0):
+        """Advise the kernel to evict a recording's cached pages (best effort)."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return  # Not created yet, or already moved away
+
+        try:
+            length = os.fstat(fd).st_size - keep_tail
+            if length > 0:
+                os.posix_fadvise(fd, 0, length, os.POSIX_FADV_DONTNEED)
+        except OSError as e:
+            log.debug(f"Could not drop {path} from the page cache: {str(e)}")
+        finally:
+            os.close(fd)
+
+    def _enlarge_pipe(self, pipe_transport, size=PIPE_SIZE):
+        """Grow the kernel buffer behind a subprocess pipe (Linux only, best effort)."""
+        if fcntl is None or F_SETPIPE_SZ is None or pipe_transport is None:
+            return
+
+        try:
+            pipe = pipe_transport.get_extra_info('pipe')
+            fcntl.fcntl(pipe.fileno(), F_SETPIPE_SZ, size)
+        except (AttributeError, OSError) as e:
+            # Unprivileged users are capped by /proc/sys/fs/pipe-max-size
+            log.debug(f"Could not resize ffmpeg pipe: {str(e)}")
+
+    async def _graceful_stop(self, timeout=5.0):
+        """Send 'q' to ffmpeg so it writes the trailer, killing it only as a fallback."""
+        process = self.process
+        try:
+            # ffmpeg's interactive 'q' flushes buffers and writes the moov atom
+            process.stdin.write(b'q\n')
+            await process.stdin.drain()
+            process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg already closed stdin, it's on its way out
+            pass
+        except Exception as e:
+            log.error(f"Error sending quit to ffmpeg: {str(e)}")
+
+        try:
+            await asyncio.wait_for(process.wait(), timeout=timeout)
+            return
+        except asyncio.TimeoutError:
+            log.warning(f"ffmpeg did not exit within {timeout:.0f}s, terminating...")
+
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=timeout)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            log.warning("ffmpeg did not terminate, killing...")
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+    def _stop_after_segment(self):
+        """Flag the capture to stop once the segment being written now completes."""
+        self.stopping = True
+
+        # Remember how much of the segment list exists, so the watcher only stops
+        # on a row ffmpeg writes after this point
+        try:
+            self._segment_list_mark = self.segment_list_path.stat().st_size
+        except (AttributeError, FileNotFoundError):
+            self._segment_list_mark = 0  # No list yet, so any row is new
 
     def _setup_signal_handlers(self):
         """Set up signal handlers for graceful exit."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(
-                sig,
-                lambda s=sig: asyncio.create_task(self._signal_handler(s))
-            )
+            loop.add_signal_handler(sig, self._signal_handler, sig)
 
-    async def _signal_handler(self, sig):
-        """Handle interrupt signals."""
+    def _signal_handler(self, sig):
+        """Handle interrupt signals by flagging the capture; start_capture does the stopping."""
         if self.segment_time and self.complete_segment and not self.stopping:
-            self.logger.info(f"Received signal {sig}, will stop after current segment completes...")
-            self.stopping = True
+            log.info(f"Received signal {sig}, will stop after current segment completes...")
+            self._stop_after_segment()
         else:
-            self.logger.info(f"Received signal {sig}, stopping capture...")
-            self.stop_capture()
+            log.info(f"Received signal {sig}, stopping capture...")
+            self.stopping = True
+            self._stop_event.set()
+
+def _cpu_arg(value):
+    """argparse type for --cpu: 'auto' or a non-negative CPU number."""
+    if value == "auto":
+        return value
+    try:
+        cpu = int(value)
+    except ValueError:
+        cpu = -1
+    if cpu < 0:
+        raise argparse.ArgumentTypeError(f"expected 'auto' or a CPU number, got {value!r}")
+    return cpu
 
 async def async_main():
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Capture HLS live stream (m3u8) until interrupted with Ctrl+C")
     parser.add_argument("url", help="URL of the m3u8 stream to capture")
@@ -316,6 +629,10 @@ async def async_main():
                         help="Enable verbose logging")
     parser.add_argument("-d", "--add-datetime", action="store_true",
                         help="Add date and time to the filename even when a custom filename is provided")
+    parser.add_argument("--cpu", type=_cpu_arg, default=None,
+                        help="Pin ffmpeg to this CPU number, or 'auto' to pick one (Linux only)")
+    parser.add_argument("--nice", type=int, default=None,
+                        help="Lower ffmpeg's scheduling priority by this amount (e.g. 5)")
 
     # Add segmentation options
     segment_group = parser.add_argument_group('segmentation', 'Options for segmenting the output into multiple files')
@@ -346,8 +663,6 @@ async def async_main():
 
             if segment_time_seconds <= 0:
                 raise ValueError("Segment time must be positive")
-
-            logging.info(f"Segmenting output every {segment_time_seconds} seconds")
         except ValueError as e:
             logging.error(f"Invalid segment time format: {str(e)}")
             sys.exit(1)
@@ -374,7 +689,9 @@ async def async_main():
             add_datetime=args.add_datetime,
             segment_time=segment_time_seconds,
             segment_format=args.segment_format,
-            complete_segment=args.complete_segment
+            complete_segment=args.complete_segment,
+            cpu=args.cpu,
+            nice=args.nice
         )
 
         # Start capturing